@@ -13,8 +13,6 @@ long_description = (here / "README.md").read_text(encoding="utf-8")
 
 setup(
     name="pyclig",  # Required
-    use_scm_version=True,
-    setup_requires=["setuptools_scm"],
     description="Command-Line Guidelines Command-Line Library",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -11,108 +11,163 @@ You may also want to add a MYAPP_NO_COLOR environment variable in case users wan
 Further reading: no-color.org, 12 Factor CLI Apps
 """
 
-from dataclasses import dataclass
-from os import getenv, stderr, stdout
-from typing import Tuple
-
-
-@dataclass
-class ColorDetectionCriteria:
-    messaging_is_tty: bool = False
-    output_is_tty: bool = False
-    no_color_env: bool = False
-    terminal_is_dumb: bool = False
-    no_color_flag: bool = False
-    pyclig_no_color_env_set: bool = False
+from functools import lru_cache
+from os import environ
+from sys import stderr, stdout
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "MESSAGING_IS_TTY",
+    "OUTPUT_IS_TTY",
+    "NO_COLOR_ENV",
+    "TERMINAL_IS_DUMB",
+    "NO_COLOR_FLAG",
+    "PYCLIG_NO_COLOR_ENV",
+    "ColorDetectionCriteria",
+    "ColorDetectionResult",
+    "ColorEnvironment",
+    "snapshot_color_environment",
+    "detect_color",
+]
+
+_FALSY_VALUES: FrozenSet[str] = frozenset(("no", "false"))
+
+
+# Bits of ColorDetectionCriteria.flags
+MESSAGING_IS_TTY = 1
+OUTPUT_IS_TTY = 2
+NO_COLOR_ENV = 4
+TERMINAL_IS_DUMB = 8
+NO_COLOR_FLAG = 16
+PYCLIG_NO_COLOR_ENV = 32
+
+# Any of these bits disables color regardless of whether the stream is a TTY
+_COLOR_DISABLED_MASK = (
+    NO_COLOR_ENV | TERMINAL_IS_DUMB | NO_COLOR_FLAG | PYCLIG_NO_COLOR_ENV
+)
+
+
+class ColorDetectionCriteria(NamedTuple):
+    flags: int = 0
+
+    @property
+    def messaging_is_tty(self) -> bool:
+        return bool(self.flags & MESSAGING_IS_TTY)
+
+    @property
+    def output_is_tty(self) -> bool:
+        return bool(self.flags & OUTPUT_IS_TTY)
+
+    @property
+    def no_color_env(self) -> bool:
+        return bool(self.flags & NO_COLOR_ENV)
+
+    @property
+    def terminal_is_dumb(self) -> bool:
+        return bool(self.flags & TERMINAL_IS_DUMB)
+
+    @property
+    def no_color_flag(self) -> bool:
+        return bool(self.flags & NO_COLOR_FLAG)
+
+    @property
+    def pyclig_no_color_env_set(self) -> bool:
+        return bool(self.flags & PYCLIG_NO_COLOR_ENV)
 
     def is_messaging_color_enabled(self) -> bool:
-        if not self.messaging_is_tty:
-            return False
-        return self._is_metadata_enabled()
+        # The TTY bit must be set and every disabling bit must be clear
+        return (
+            self.flags & (MESSAGING_IS_TTY | _COLOR_DISABLED_MASK) == MESSAGING_IS_TTY
+        )
 
     def is_output_color_enabled(self) -> bool:
-        if not self.output_is_tty:
-            return False
-        return self._is_metadata_enabled()
+        return self.flags & (OUTPUT_IS_TTY | _COLOR_DISABLED_MASK) == OUTPUT_IS_TTY
 
-    def _is_metadata_enabled(self) -> bool:
-        if self.no_color_flag:
-            return False
 
-        if self.no_color_env or self.pyclig_no_color_env_set:
-            return False
+class ColorDetectionResult(NamedTuple):
+    criteria: ColorDetectionCriteria
+    enable_output_color: bool = True
+    enable_messaging_color: bool = True
 
-        if self.terminal_is_dumb:
-            return False
 
-        return True
+class ColorEnvironment(NamedTuple):
+    no_color: Optional[str] = None
+    pyclig_no_color: Optional[str] = None
+    term: Optional[str] = None
+
+
+def snapshot_color_environment() -> ColorEnvironment:
+    """Capture the environment variables which affect color detection.
+
+    Taking the snapshot once and passing it to detect_color() means the
+    environment is never queried again after that point.
+    """
+    return ColorEnvironment(
+        environ.get("NO_COLOR"), environ.get("PYCLIG_NO_COLOR"), environ.get("TERM")
+    )
+
+
+@lru_cache(maxsize=2)
+def detect_color(
+    environment: ColorEnvironment, disable_color: bool = False
+) -> ColorDetectionResult:
+    """Disable color if your program is not in a terminal or the user requested it.
+
+    These things should disable colors:
+
+      * stdout or stderr is not an interactive terminal (a TTY). It’s best to individually check—if you’re piping stdout to another program, it’s still useful to get colors on stderr.
+      * The NO_COLOR environment variable is set.
+      * The TERM environment variable has the value dumb.
+      * The user passes the option --no-color.
+      * You may also want to add a MYAPP_NO_COLOR environment variable in case users want to disable color specifically for your program.
+
+      Further reading: no-color.org, 12 Factor CLI Apps
+
+    The environment is read from the given snapshot (see
+    snapshot_color_environment()) rather than from os.environ, so the result
+    is a pure function of its arguments and is cached.
+    """
+    if disable_color:
+        # --no-color disables color no matter what else is detected, so
+        # there is no need to query the terminals or the environment.
+        return ColorDetectionResult(ColorDetectionCriteria(NO_COLOR_FLAG), False, False)
+
+    evaluation = ColorDetectionCriteria(
+        (MESSAGING_IS_TTY if _is_stderr_tty() else 0)
+        | (OUTPUT_IS_TTY if _is_stdout_tty() else 0)
+        | (NO_COLOR_ENV if _is_no_color_env_var_set(environment.no_color) else 0)
+        | (TERMINAL_IS_DUMB if _is_terminal_dumb(environment.term) else 0)
+        | (
+            PYCLIG_NO_COLOR_ENV
+            if _is_pyclig_no_color_env_var_set(environment.pyclig_no_color)
+            else 0
+        )
+    )
+    # Positional arguments follow field order: (criteria, output, messaging)
+    return ColorDetectionResult(
+        evaluation,
+        evaluation.is_output_color_enabled(),
+        evaluation.is_messaging_color_enabled(),
+    )
 
 
-@dataclass
-class ColorDetectionResult:
-    criteria: ColorDetectionCriteria
-    enable_output_color: bool = True
-    enable_messaging_color: bool = True
+def _is_no_color_env_var_set(value: Optional[str]) -> bool:
+    return value is not None and value.lower() not in _FALSY_VALUES
 
 
-class ColorDetection:
-    _user_flag_no_color_set: bool = False
+def _is_pyclig_no_color_env_var_set(value: Optional[str]) -> bool:
+    return value is not None and value.lower() not in _FALSY_VALUES
 
-    def __init__(self, disable_color: bool = False):
-        self._user_flag_no_color_set = disable_color
 
-    def evaluate(self) -> ColorDetectionResult:
-        """Disable color if your program is not in a terminal or the user requested it.
+def _is_terminal_dumb(value: Optional[str]) -> bool:
+    return value is not None and value.lower() == "dumb"
 
-        These things should disable colors:
 
-          * stdout or stderr is not an interactive terminal (a TTY). It’s best to individually check—if you’re piping stdout to another program, it’s still useful to get colors on stderr.
-          * The NO_COLOR environment variable is set.
-          * The TERM environment variable has the value dumb.
-          * The user passes the option --no-color.
-          * You may also want to add a MYAPP_NO_COLOR environment variable in case users want to disable color specifically for your program.
+@lru_cache(maxsize=1)
+def _is_stdout_tty() -> bool:
+    return stdout.isatty()
 
-          Further reading: no-color.org, 12 Factor CLI Apps
-        """
-        evaluation = ColorDetectionCriteria(
-            messaging_is_tty=self._is_stderr_tty(),
-            output_is_tty=self._is_stdout_tty(),
-            no_color_env=self._is_no_color_env_var_set(),
-            terminal_is_dumb=self._is_terminal_dumb(),
-            no_color_flag=self._user_flag_no_color_set,
-            pyclig_no_color_env_set=self._is_pyclig_no_color_env_var_set(),
-        )
-        return ColorDetectionResult(
-            enable_messaging_color=evaluation.is_messaging_color_enabled(),
-            enable_output_color=evaluation.is_output_color_enabled(),
-            criteria=evaluation,
-        )
 
-    @staticmethod
-    def _is_no_color_env_var_set() -> bool:
-        value = getenv("NO_COLOR")
-        if value is None or value.lower() in ["no", "false"]:
-            return False
-        return True
-
-    @staticmethod
-    def _is_pyclig_no_color_env_var_set() -> bool:
-        value = getenv("PYCLIG_NO_COLOR")
-        if value is None or value.lower() in ["no", "false"]:
-            return False
-        return True
-
-    @staticmethod
-    def _is_terminal_dumb() -> bool:
-        value = getenv("TERM")
-        if value is None or value.lower() != "dumb":
-            return False
-        return True
-
-    @staticmethod
-    def _is_stdout_tty() -> bool:
-        return stdout.is_tty()
-
-    @staticmethod
-    def _is_stderr_tty() -> bool:
-        return stderr.is_tty()
+@lru_cache(maxsize=1)
+def _is_stderr_tty() -> bool:
+    return stderr.isatty()
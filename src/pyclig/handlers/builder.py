@@ -3,7 +3,12 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import Any, TypedDict
 
-from pyclig.color.detection import ColorDetection
+from pyclig.color.detection import (
+    ColorDetectionResult,
+    ColorEnvironment,
+    detect_color,
+    snapshot_color_environment,
+)
 
 
 class HandlerVerbosity(IntEnum):
@@ -31,7 +36,11 @@ class HandlerBuilder:
     _output_options: Options
     _messaging_options: Options
 
+    _env_snapshot: ColorEnvironment
+    _color_state: ColorDetectionResult
+
     def __init__(self, output_config: Options, messaging_config: Options) -> None:
         self._output_options = output_config
         self._messaging_options = messaging_config
-        self._color_detector = ColorDetection(disable_color=False)
+        self._env_snapshot = snapshot_color_environment()
+        self._color_state = detect_color(self._env_snapshot, disable_color=False)
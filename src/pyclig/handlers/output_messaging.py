@@ -1,10 +1,17 @@
-from dataclasses import dataclass
 from logging import DEBUG, WARNING, NullHandler, StreamHandler
-from os import stderr, stdout
-from typing import Protocol
+from sys import stderr, stdout
+from typing import NamedTuple
 
 from pyclig.filters.info_filter import InfoFilter
 
+# InfoFilter holds no state, so every output handler can share one instance
+_INFO_FILTER = InfoFilter()
+
+
+class OutputMessagingHandlersResult(NamedTuple):
+    output_handler: StreamHandler
+    messaging_handler: StreamHandler
+
 
 def new_output_messaging_handlers(
     output_level: int = DEBUG, messaging_level: int = WARNING
@@ -25,7 +32,7 @@ def new_output_messaging_handlers(
     messaging_handler = StreamHandler(stderr)
 
     output_handler.setLevel(output_level)
-    output_handler.addFilter(InfoFilter())
+    output_handler.addFilter(_INFO_FILTER)
 
     messaging_handler.setLevel(messaging_level)
 
@@ -34,13 +41,12 @@ def new_output_messaging_handlers(
     )
 
 
-@dataclass
-class NullHandlersResult(OutputMessagingHandlerPair):
+class NullHandlersResult(NamedTuple):
     output_handler: NullHandler
     messaging_handler: NullHandler
 
 
 def new_null_handlers() -> NullHandlersResult:
     return NullHandlersResult(
-        output_handler=NullHandler(), messaging_handle=NullHandler()
+        output_handler=NullHandler(), messaging_handler=NullHandler()
     )